@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 import dj_database_url
@@ -92,6 +93,15 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # Keep the test database in memory: no disk I/O, and the
+            # connection lives for the whole test run. Build its tables
+            # straight from the models instead of replaying migrations
+            # (none of them carry data)
+            "TEST": {"NAME": ":memory:", "MIGRATE": False},
+            # Sort and temp-index scratch space stays in RAM. The journal mode
+            # is left alone: in-memory databases already journal in memory,
+            # and the on-disk dev database keeps its crash-safe default
+            "OPTIONS": {"init_command": "PRAGMA temp_store = MEMORY;"},
         }
     }
 
@@ -111,6 +121,13 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Fast password hashing for the test suite (`manage.py test`); test users'
+# passwords don't need PBKDF2's work factor
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -18,7 +18,7 @@ def generate_low_activity_alerts():
     parent_profiles = UserProfile.objects.filter(
         role='parent',
         alert_low_activity=True
-    )
+    ).select_related('user').prefetch_related('linked_students')
 
     for parent_profile in parent_profiles:
         for student in parent_profile.get_children():
@@ -64,7 +64,7 @@ def generate_goal_at_risk_alerts():
     parents_profiles = UserProfile.objects.filter(
         role='parent',
         alert_goal_at_risk=True
-    )
+    ).select_related('user').prefetch_related('linked_students')
 
     for parent_profile in parents_profiles:
         for student in parent_profile.get_children():
@@ -72,7 +72,7 @@ def generate_goal_at_risk_alerts():
             goals = TermGoal.objects.filter(
                 subject__user=student,
                 deadline__gte=date.today()
-            )
+            ).select_related('subject')
 
             for goal in goals:
                 days_until_deadline = (goal.deadline - date.today()).days
@@ -115,7 +115,7 @@ def generate_milestone_alerts():
     parent_profiles = UserProfile.objects.filter(
         role='parent',
         alert_milestones=True
-    )
+    ).select_related('user').prefetch_related('linked_students')
     
     milestones = [25, 50, 75, 100]
     
@@ -125,7 +125,7 @@ def generate_milestone_alerts():
             roadmaps = Roadmap.objects.filter(
                 subject__user=student,
                 is_active=True
-            )
+            ).select_related('subject')
             
             for roadmap in roadmaps:
                 progress = roadmap.calculate_overall_progress()
@@ -167,14 +167,14 @@ def generate_roadmap_completed_alerts():
     parent_profiles = UserProfile.objects.filter(
         role='parent',
         alert_roadmap_completed=True
-    )
+    ).select_related('user').prefetch_related('linked_students')
 
     for parent_profile in parent_profiles:
         for student in parent_profile.get_children():
             # Get recently completed roadmaps (100% progress)
             roadmaps = Roadmap.objects.filter(
                 subject__user=student
-            )
+            ).select_related('subject')
 
             for roadmap in roadmaps:
                 if roadmap.calculate_overall_progress() == 100:
@@ -208,7 +208,7 @@ def generate_streak_broken_alerts():
     parents_profiles = UserProfile.objects.filter(
         role='parent',
         alert_streak_broken=True,
-    )
+    ).select_related('user').prefetch_related('linked_students')
 
     for parent_profile in parents_profiles:
         for student in parent_profile.get_children():
@@ -253,7 +253,7 @@ def generate_new_feedback_alerts():
     parent_profiles = UserProfile.objects.filter(
         role='parent',
         alert_new_feedback=True
-    )
+    ).select_related('user').prefetch_related('linked_students')
 
     # Only check for feedback from last 24 hours
     yesterday = timezone.now() - timedelta(days=1)
@@ -264,7 +264,7 @@ def generate_new_feedback_alerts():
             new_feedbacks = Feedback.objects.filter(
                 subject__user=student,
                 created_at__gte=yesterday
-            )
+            ).select_related('subject')
 
             for feedback in new_feedbacks:
                 # Check if already alerted
@@ -284,7 +284,8 @@ class UserRegistrationForm(UserCreationForm):
         email = self.cleaned_data.get('email')
         if User.objects.filter(email=email).exists():
             raise forms.ValidationError(
-                'This email address is already registered. Please user a different email or try logging in.'
+                'This email address is already registered. Please user a different email or try logging in.',
+                code='duplicate_email',
             )
         return email
     
@@ -293,7 +294,8 @@ class UserRegistrationForm(UserCreationForm):
         username = self.cleaned_data.get('username')
         if User.objects.filter(username=username).exists():
             raise forms.ValidationError(
-                'This username is already taken. Please choose a different username.'
+                'This username is already taken. Please choose a different username.',
+                code='duplicate_username',
             )
         return username
     
@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
 from tracker.models import Subject, UserProfile, Feedback
@@ -10,22 +10,22 @@ from django.contrib.messages import get_messages
 class FeedbackModelTest(TestCase):
     """Test cases for the Feedback model"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+        cls.today = date.today()
+
+        cls.user = User.objects.create_user(username='testuser')
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths'
         )
     
@@ -36,7 +36,7 @@ class FeedbackModelTest(TestCase):
             strengths='Good at algebra',
             weaknesses='Needs work on geometry',
             areas_to_improve='Practice more problems',
-            feedback_date=date.today()
+            feedback_date=self.today
         )
         
         self.assertEqual(feedback.subject, self.subject)
@@ -81,6 +81,10 @@ class FeedbackModelTest(TestCase):
 
 class FeedbackFormTest(TestCase):
     """Test cases for the FeedbackForm"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date.today()
     
     def test_form_with_valid_data(self):
         """Test form with valid data"""
@@ -88,7 +92,7 @@ class FeedbackFormTest(TestCase):
             'strengths': 'Good understanding of algebra',
             'weaknesses': 'Struggles with geometry',
             'areas_to_improve': 'Practice more geometry problems',
-            'feedback_date': date.today()
+            'feedback_date': self.today
         }
         
         form = FeedbackForm(data=form_data)
@@ -100,7 +104,7 @@ class FeedbackFormTest(TestCase):
             'strengths': 'Good',
             'weaknesses': '',  # Missing required field
             'areas_to_improve': 'Improve',
-            'feedback_date': date.today()
+            'feedback_date': self.today
         }
         
         form = FeedbackForm(data=form_data)
@@ -119,37 +123,31 @@ class FeedbackFormTest(TestCase):
 class AddFeedbackViewTest(TestCase):
     """Test cases for add feedback view"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+        cls.today = date.today()
+        cls.today_iso = cls.today.isoformat()
+
+        cls.user = User.objects.create_user(username='testuser')
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='english'
         )
         
-        self.add_feedback_url = reverse('tracker:add_feedback', args=[self.subject.pk])
-    
-    def test_add_feedback_requires_login(self):
-        """Test that add feedback requires authentication"""
-        response = self.client.get(self.add_feedback_url)
-        self.assertEqual(response.status_code, 302)
-        self.assertIn('/accounts/login/', response.url)
+        cls.add_feedback_url = reverse('tracker:add_feedback', args=[cls.subject.pk])
     
     def test_add_feedback_get_request(self):
         """Test GET request shows form"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
         response = self.client.get(self.add_feedback_url)
         
@@ -158,109 +156,105 @@ class AddFeedbackViewTest(TestCase):
         self.assertIn('form', response.context)
         self.assertEqual(response.context['subject'], self.subject)
     
-    def test_add_feedback_post_valid_data(self):
-        """Test adding feedback with valid data"""
-        self.client.login(username='testuser', password='testpass123')
-        
-        data = {
-            'strengths': 'Excellent writing skills',
-            'weaknesses': 'Grammar needs improvement',
-            'areas_to_improve': 'Practice punctuation',
-            'feedback_date': date.today().isoformat()  # Fixed: Use isoformat for date
-        }
-        
-        response = self.client.post(self.add_feedback_url, data)
-        
-        # Should redirect to subject detail
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.url, reverse('tracker:subject_detail', args=[self.subject.pk]))
-        
-        # Feedback should be created
-        self.assertEqual(Feedback.objects.count(), 1)
-        feedback = Feedback.objects.first()
-        self.assertEqual(feedback.subject, self.subject)
-        self.assertEqual(feedback.strengths, 'Excellent writing skills')
-    
-    def test_add_feedback_post_invalid_data(self):
-        """Test adding feedback with invalid data"""
-        self.client.login(username='testuser', password='testpass123')
-        
-        data = {
-            'strengths': '',  # Missing required field
-            'weaknesses': 'Test',
-            'areas_to_improve': 'Test',
-            'feedback_date': date.today().isoformat()  # Fixed: Use isoformat
-        }
-        
-        response = self.client.post(self.add_feedback_url, data)
-        
-        # Should show form with errors
-        self.assertEqual(response.status_code, 200)
-        self.assertIn('strengths', response.context['form'].errors)
-        
-        # No feedback should be created
-        self.assertEqual(Feedback.objects.count(), 0)
-    
-    def test_add_feedback_success_message(self):
-        """Test success message after adding feedback"""
-        self.client.login(username='testuser', password='testpass123')
-        
-        data = {
-            'strengths': 'Good',
-            'weaknesses': 'Needs work',
-            'areas_to_improve': 'Practice',
-            'feedback_date': date.today().isoformat()  # Fixed: Use isoformat
-        }
-        
-        response = self.client.post(self.add_feedback_url, data, follow=True)
-        
-        messages = list(get_messages(response.wsgi_request))
-        self.assertEqual(len(messages), 1)
-        self.assertIn('has been added successfully', str(messages[0]))
+    def test_add_feedback_post(self):
+        """Test adding feedback with invalid and valid data"""
+        self.client.force_login(self.user)
+        
+        cases = [
+            # (data, expected status, field with errors)
+            (
+                {
+                    'strengths': '',  # Missing required field
+                    'weaknesses': 'Test',
+                    'areas_to_improve': 'Test',
+                    'feedback_date': self.today_iso
+                },
+                200, 'strengths',
+            ),
+            (
+                {
+                    'strengths': 'Excellent writing skills',
+                    'weaknesses': 'Grammar needs improvement',
+                    'areas_to_improve': 'Practice punctuation',
+                    'feedback_date': self.today_iso
+                },
+                302, None,
+            ),
+        ]
+        
+        for data, expected_status, error_field in cases:
+            with self.subTest(strengths=data['strengths']):
+                response = self.client.post(self.add_feedback_url, data)
+                messages = list(get_messages(response.wsgi_request))
+                
+                self.assertEqual(response.status_code, expected_status)
+                
+                if error_field:
+                    # Should show form with errors and no message
+                    self.assertIn(error_field, response.context['form'].errors)
+                    self.assertEqual(len(messages), 0)
+                    self.assertFalse(Feedback.objects.filter(subject=self.subject).exists())
+                else:
+                    # Should redirect to subject detail with a success message
+                    self.assertEqual(response.url, reverse('tracker:subject_detail', args=[self.subject.pk]))
+                    self.assertTrue(Feedback.objects.filter(
+                        subject=self.subject,
+                        strengths='Excellent writing skills'
+                    ).exists())
+                    self.assertEqual(len(messages), 1)
+                    self.assertIn('has been added successfully', str(messages[0]))
 
 
 class EditFeedbackViewTest(TestCase):
     """Test cases for edit feedback view"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+        cls.today = date.today()
+        cls.today_iso = cls.today.isoformat()
+
+        cls.user = User.objects.create_user(username='testuser')
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='science'
         )
         
-        self.feedback = Feedback.objects.create(
-            subject=self.subject,
+        cls.feedback = Feedback.objects.create(
+            subject=cls.subject,
             strengths='Good practical skills',
             weaknesses='Theory needs work',
             areas_to_improve='Read textbook',
-            feedback_date=date.today()
+            feedback_date=cls.today
         )
         
-        self.edit_url = reverse('tracker:edit_feedback', args=[self.feedback.pk])
-    
-    def test_edit_feedback_requires_login(self):
-        """Test that edit feedback requires authentication"""
-        response = self.client.get(self.edit_url)
-        self.assertEqual(response.status_code, 302)
-        self.assertIn('/accounts/login/', response.url)
+        cls.edit_url = reverse('tracker:edit_feedback', args=[cls.feedback.pk])
+
+        # Feedback owned by someone else
+        other_user = User.objects.create_user(username='otheruser')
+        other_subject = Subject.objects.create(
+            user=other_user,
+            name='maths'
+        )
+        cls.other_feedback = Feedback.objects.create(
+            subject=other_subject,
+            strengths='Test',
+            weaknesses='Test',
+            areas_to_improve='Test',
+            feedback_date=cls.today
+        )
     
     def test_edit_feedback_get_request(self):
         """Test GET request shows form with existing data"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
         response = self.client.get(self.edit_url)
         
@@ -270,13 +264,13 @@ class EditFeedbackViewTest(TestCase):
     
     def test_edit_feedback_post_valid_data(self):
         """Test updating feedback with valid data"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
         data = {
             'strengths': 'Updated strengths',
             'weaknesses': 'Updated weaknesses',
             'areas_to_improve': 'Updated areas',
-            'feedback_date': date.today().isoformat()  # Fixed: Use isoformat
+            'feedback_date': self.today_iso
         }
         
         response = self.client.post(self.edit_url, data)
@@ -290,24 +284,8 @@ class EditFeedbackViewTest(TestCase):
     
     def test_user_cannot_edit_other_users_feedback(self):
         """Test that users cannot edit other users' feedback"""
-        other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
-        other_subject = Subject.objects.create(
-            user=other_user,
-            name='maths'
-        )
-        other_feedback = Feedback.objects.create(
-            subject=other_subject,
-            strengths='Test',
-            weaknesses='Test',
-            areas_to_improve='Test',
-            feedback_date=date.today()
-        )
-        
-        self.client.login(username='testuser', password='testpass123')
-        other_edit_url = reverse('tracker:edit_feedback', args=[other_feedback.pk])
+        self.client.force_login(self.user)
+        other_edit_url = reverse('tracker:edit_feedback', args=[self.other_feedback.pk])
         
         response = self.client.get(other_edit_url)
         
@@ -318,45 +296,38 @@ class EditFeedbackViewTest(TestCase):
 class DeleteFeedbackViewTest(TestCase):
     """Test cases for delete feedback view"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+        cls.today = date.today()
+
+        cls.user = User.objects.create_user(username='testuser')
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='mandarin'
         )
         
-        self.feedback = Feedback.objects.create(
-            subject=self.subject,
+        cls.feedback = Feedback.objects.create(
+            subject=cls.subject,
             strengths='Good pronunciation',
             weaknesses='Character writing',
             areas_to_improve='Practice writing',
-            feedback_date=date.today()
+            feedback_date=cls.today
         )
         
-        self.delete_url = reverse('tracker:delete_feedback', args=[self.feedback.pk])
-    
-    def test_delete_feedback_requires_login(self):
-        """Test that delete feedback requires authentication"""
-        response = self.client.get(self.delete_url)
-        self.assertEqual(response.status_code, 302)
-        self.assertIn('/accounts/login/', response.url)
+        cls.delete_url = reverse('tracker:delete_feedback', args=[cls.feedback.pk])
     
     def test_delete_feedback_get_shows_confirmation(self):
         """Test GET request shows confirmation page"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
         response = self.client.get(self.delete_url)
         
@@ -366,7 +337,7 @@ class DeleteFeedbackViewTest(TestCase):
     
     def test_delete_feedback_post_deletes_feedback(self):
         """Test POST request deletes feedback"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
         response = self.client.post(self.delete_url)
         
@@ -379,10 +350,34 @@ class DeleteFeedbackViewTest(TestCase):
     
     def test_delete_feedback_success_message(self):
         """Test success message after deletion"""
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
         
-        response = self.client.post(self.delete_url, follow=True)
+        response = self.client.post(self.delete_url)
+        self.assertEqual(response.status_code, 302)
         
         messages = list(get_messages(response.wsgi_request))
         self.assertEqual(len(messages), 1)
-        self.assertIn('has been deleted', str(messages[0]))
\ No newline at end of file
+        self.assertIn('has been deleted', str(messages[0]))
+
+
+class FeedbackAuthTest(TestCase):
+    """Test that feedback views require login (no fixtures needed)"""
+    
+    def test_add_feedback_requires_login(self):
+        """Test that add feedback requires authentication"""
+        # login_required redirects before the subject is looked up
+        response = self.client.get(reverse('tracker:add_feedback', args=[1]))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/accounts/login/', response.url)
+    
+    def test_edit_feedback_requires_login(self):
+        """Test that edit feedback requires authentication"""
+        response = self.client.get(reverse('tracker:edit_feedback', args=[1]))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/accounts/login/', response.url)
+    
+    def test_delete_feedback_requires_login(self):
+        """Test that delete feedback requires authentication"""
+        response = self.client.get(reverse('tracker:delete_feedback', args=[1]))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/accounts/login/', response.url)
@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from tracker.models import Subject, UserProfile, StudySession
 from datetime import date
 
@@ -9,17 +9,17 @@ from datetime import date
 class SubjectModelTest(TestCase):
     """Test cases for the Subject model."""
 
-    def setUp(self):
-        """Set up test data before each test"""
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test"""
+        cls.today = date.today()
+
         # Create a test user
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+        cls.user = User.objects.create_user(username='testuser')
 
         # Create user profile
-        self.profile = UserProfile.objects.create(
-            user=self.user,
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9,
@@ -65,8 +65,9 @@ class SubjectModelTest(TestCase):
             name='science',
         )
 
-        # Trying to create the same subject again should raise an IntegrityError
-        with self.assertRaises(IntegrityError):
+        # Trying to create the same subject again should raise an IntegrityError.
+        # The savepoint keeps the test's transaction usable afterwards.
+        with self.assertRaises(IntegrityError), transaction.atomic():
             Subject.objects.create(
                 user=self.user,
                 name='science',
@@ -74,10 +75,7 @@ class SubjectModelTest(TestCase):
 
     def test_different_users_can_have_same_subject(self):
         """Test that different users can have the same subject"""
-        user2 = User.objects.create_user(
-            username='testuser2',
-            password='testpass123'
-        )
+        user2 = User.objects.create_user(username='testuser2')
 
         subject1 = Subject.objects.create(
             user=self.user,
@@ -113,14 +111,14 @@ class SubjectModelTest(TestCase):
             user=self.user,
             subject=subject,
             hours_spent=2.5,
-            session_date=date.today()
+            session_date=self.today
         )
 
         StudySession.objects.create(
             user=self.user,
             subject=subject,
             hours_spent=1.5,
-            session_date=date.today()
+            session_date=self.today
         )
 
         self.assertEqual(subject.get_total_study_hours(), 4.0)
@@ -146,7 +144,7 @@ class SubjectModelTest(TestCase):
             user=self.user,
             subject=subject,
             hours_spent=1.0,
-            session_date=date.today()
+            session_date=self.today
         )
 
         subject_id = subject.id
@@ -161,12 +159,15 @@ class SubjectModelTest(TestCase):
 
     def test_subject_ordering(self):
         """Test that subjects are ordered by name"""
-        Subject.objects.create(user=self.user, name='science')
-        Subject.objects.create(user=self.user, name='english')
-        Subject.objects.create(user=self.user, name='maths')
+        Subject.objects.bulk_create([
+            Subject(user=self.user, name=name)
+            for name in ('science', 'english', 'maths')
+        ])
 
-        subjects = Subject.objects.filter(user=self.user)
-        name = [s.name for s in subjects]
+        # Relies on Meta.ordering, so no explicit order_by()
+        name = list(
+            Subject.objects.filter(user=self.user).values_list('name', flat=True)
+        )
 
         # Should be ordered alphabetically by name
         self.assertEqual(name, ['english', 'maths', 'science'])
@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
@@ -9,19 +9,41 @@ from tracker.models import (
 )
 
 
-class UserProfileParentTest(TestCase):
-    """Test the UserProfile model with parent role."""
+class ParentTestFixtureMixin:
+    """Shared parent and linked student, each with a profile."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date.today()
+
+        # Create users
+        cls.parent_user = User.objects.create_user(username='parent1')
+        cls.student_user = User.objects.create_user(username='student1')
+
+        # Create profiles
+        cls.parent_profile = UserProfile.objects.create(
+            user=cls.parent_user,
+            role='parent',
+            full_name='Parent One'
         )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
+        cls.parent_profile.linked_students.add(cls.student_user)
+
+        UserProfile.objects.create(
+            user=cls.student_user,
+            role='student',
+            full_name='Student One',
+            year_group=10
         )
 
+
+class UserProfileParentTest(TestCase):
+    """Test the UserProfile model with parent role."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_user = User.objects.create_user(username='parent1')
+        cls.student_user = User.objects.create_user(username='student1')
+
     def test_create_parent_profile(self):
         """Test creating a parent user profile."""
         profile = UserProfile.objects.create(
@@ -70,201 +92,118 @@ class UserProfileParentTest(TestCase):
         self.assertEqual(children.count(), 0)
 
 
-class ParentDashboardAccessTest(TestCase):
+class ParentDashboardAccessTest(ParentTestFixtureMixin, TestCase):
     """Test access control for parent dashboard."""
 
-    def setUp(self):
-        self.client = Client()
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
-        self.other_user = User.objects.create_user(
-            username='other_user',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
-        # Create parent profile
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One'
-        )
-        self.parent_profile.linked_students.add(self.student_user)
-
-        # Create student profile
-        UserProfile.objects.create(
-            user=self.student_user,
-            role='student',
-            full_name='Student One',
-            year_group=10
-        )
-
-        self.url = reverse('tracker:parent_dashboard')
-
-    def test_parent_dashboard_requires_login(self):
-        """Test that parent dashboard requires authentication."""
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, 302) # Redirect to login
-        self.assertIn('/accounts/login/', response.url)
+        cls.url = reverse('tracker:parent_dashboard')
 
     def test_parent_with_profile_can_access(self):
         """Test that parent with profile can access dashboard"""
-        self.client.login(username='parent1', password='testpass123')
+        self.client.force_login(self.parent_user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'tracker/parent_dashboard.html')
 
     def test_student_user_cannot_access_parent_dashboard(self):
         """Test that student users cannot access parent dashboard."""
-        self.client.login(username='student1', password='testpass123')
+        self.client.force_login(self.student_user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302) # Redirect
 
     def test_parent_with_no_children_sees_message(self):
         """Test parent with no linked children sees appropriate message."""
         # Create parent with no children
-        lonely_parent = User.objects.create_user(
-            username='lonely_parent',
-            password='testpass123'
-        )
+        lonely_parent = User.objects.create_user(username='lonely_parent')
         UserProfile.objects.create(
             user=lonely_parent,
             role='parent',
             full_name='Lonely Parent'
         )
 
-        self.client.login(username='lonely_parent', password='testpass123')
+        self.client.force_login(lonely_parent)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302) # Redirected
 
 
-class ParentDashboardDataTest(TestCase):
+class ParentDashboardDataTest(ParentTestFixtureMixin, TestCase):
     """Test data display on parent dashboard."""
 
-    def setUp(self):
-        self.client = Client()
-
-        # Create users
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
-
-        # Create profiles
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One'
-        )
-        self.parent_profile.linked_students.add(self.student_user)
-
-        UserProfile.objects.create(
-            user=self.student_user,
-            role='student',
-            full_name='Student One',
-            year_group=10
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
         # Create subject
-        self.subject = Subject.objects.create(
-            user=self.student_user,
+        cls.subject = Subject.objects.create(
+            user=cls.student_user,
             name='maths'
         )
 
         # Create study sessions
-        for i in range(3):
-            StudySession.objects.create(
-                user=self.student_user,
-                subject=self.subject,
+        StudySession.objects.bulk_create([
+            StudySession(
+                user=cls.student_user,
+                subject=cls.subject,
                 hours_spent=2.0,
-                session_date=date.today() - timedelta(days=i)
+                session_date=cls.today - timedelta(days=i)
             )
+            for i in range(3)
+        ])
 
-        self.url = reverse('tracker:parent_dashboard')
+        cls.url = reverse('tracker:parent_dashboard')
 
     def test_dashboard_shows_student_name(self):
         """Test that dashboard displays student name."""
-        self.client.login(username='parent1', password='testpass123')
-        response = self.client.get(self.url)
-
-        self.assertContains(response, 'Student1')
-
+        self.client.force_login(self.parent_user)
 
-class ParentStudentDetailTest(TestCase):
-    """Test parent student detail view."""
+        # Session, user and profile lookups, then per-child metrics and
+        # per-subject progress. Guards against N+1 regressions in the view.
+        with self.assertNumQueries(19):
+            response = self.client.get(self.url)
 
-    def setUp(self):
-        self.client = Client()
+        children_data = response.context['children_data']
+        self.assertEqual(len(children_data), 1)
+        self.assertEqual(children_data[0]['student'], self.student_user)
 
-        # Create users
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
-        self.other_student = User.objects.create_user(
-            username='other_student',
-            password='testpass123'
-        )
 
-        # Create profiles
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One'
-        )
-        self.parent_profile.linked_students.add(self.student_user)
+class ParentStudentDetailTest(ParentTestFixtureMixin, TestCase):
+    """Test parent student detail view."""
 
-        UserProfile.objects.create(
-            user=self.student_user,
-            role='student',
-            full_name='Student One',
-            year_group=10
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
+        # Student not linked to the parent
+        cls.other_student = User.objects.create_user(username='other_student')
         UserProfile.objects.create(
-            user=self.other_student,
+            user=cls.other_student,
             role='student',
             full_name='Other Student',
             year_group=11
         )
 
         # Create subject and data
-        self.subject = Subject.objects.create(
-            user=self.student_user,
+        cls.subject = Subject.objects.create(
+            user=cls.student_user,
             name='maths',
             description='Test description'
         )
 
         StudySession.objects.create(
-            user=self.student_user,
-            subject=self.subject,
+            user=cls.student_user,
+            subject=cls.subject,
             hours_spent=3.5,
-            session_date=date.today()
+            session_date=cls.today
         )
 
-        self.url = reverse('tracker:parent_student_detail', args=[self.student_user.id])
-
-    def test_detail_requires_login(self):
-        """Test that detail view requires authentication."""
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, 302) # Redirect to login
+        cls.url = reverse('tracker:parent_student_detail', args=[cls.student_user.id])
 
     def test_parent_can_view_own_child_detail(self):
         """Test that parent can view their own child's detail."""
-        self.client.login(username='parent1', password='testpass123')
+        self.client.force_login(self.parent_user)
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
@@ -274,14 +213,30 @@ class ParentStudentDetailTest(TestCase):
         """Test that parent cannot view unlinked student's detail."""
         other_url = reverse('tracker:parent_student_detail', args=[self.other_student.id])
 
-        self.client.login(username='parent1', password='testpass123')
+        self.client.force_login(self.parent_user)
         response = self.client.get(other_url)
 
         self.assertEqual(response.status_code, 302) # Redirected
 
     def test_student_cannot_access_detail_view(self):
         """Test that students cannot access parent detail view."""
-        self.client.login(username='student1', password='testpass123')
+        self.client.force_login(self.student_user)
         response = self.client.get(self.url)
 
-        self.assertEqual(response.status_code, 302) # Redirected
\ No newline at end of file
+        self.assertEqual(response.status_code, 302) # Redirected
+
+
+class ParentAuthTest(TestCase):
+    """Test that parent views require login (no fixtures needed)."""
+
+    def test_parent_dashboard_requires_login(self):
+        """Test that parent dashboard requires authentication."""
+        response = self.client.get(reverse('tracker:parent_dashboard'))
+        self.assertEqual(response.status_code, 302) # Redirect to login
+        self.assertIn('/accounts/login/', response.url)
+
+    def test_detail_requires_login(self):
+        """Test that detail view requires authentication."""
+        # login_required redirects before the student is looked up
+        response = self.client.get(reverse('tracker:parent_student_detail', args=[1]))
+        self.assertEqual(response.status_code, 302) # Redirect to login
@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase, RequestFactory
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
@@ -15,27 +15,30 @@ from tracker.alerts import(
     generate_roadmap_completed_alerts,
     generate_all_alerts
 )
+from tracker.views import parent_alert_history
+
+
+# Resolved once at import and shared by every test
+ALERT_HISTORY_URL = reverse('tracker:parent_alert_history')
+MARK_ALL_ALERTS_READ_URL = reverse('tracker:mark_all_alerts_read')
 
 
 class ProgressAlertModelTest(TestCase):
     """Test the ProgressAlert model."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_user = User.objects.create_user(
             username='parent1',
-            password='testpass123',
             email='parent@test.com'
         )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
+        cls.student_user = User.objects.create_user(username='student1')
+        cls.parent_profile = UserProfile.objects.create(
+            user=cls.parent_user,
             role='parent',
             full_name='Parent One'
         )
-        self.parent_profile.linked_students.add(self.student_user)
+        cls.parent_profile.linked_students.add(cls.student_user)
 
     def test_create_progress_alert(self):
         """Test creating a progress alert."""
@@ -92,33 +95,40 @@ class ProgressAlertModelTest(TestCase):
         self.assertIsNotNone(alert.sent_at)
 
 
-class LowActivityAlertTest(TestCase):
-    """Test low activity alert generation."""
+class AlertGeneratorFixtureMixin:
+    """Shared parent, linked student and student's maths subject."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
+    # Alert preferences for the parent profile, set by each test class
+    alert_settings = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        # One date and timestamp shared by every test
+        cls.today = date.today()
+        cls.now = timezone.now()
+
+        cls.parent_user = User.objects.create_user(username='parent1')
+        cls.student_user = User.objects.create_user(username='student1')
 
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
+        cls.parent_profile = UserProfile.objects.create(
+            user=cls.parent_user,
             role='parent',
             full_name='Parent One',
-            alert_low_activity=True,
-            alert_low_activity_days=3
+            **cls.alert_settings
         )
-        self.parent_profile.linked_students.add(self.student_user)
+        cls.parent_profile.linked_students.add(cls.student_user)
 
-        self.subject = Subject.objects.create(
-            user=self.student_user,
+        cls.subject = Subject.objects.create(
+            user=cls.student_user,
             name='maths'
         )
 
+
+class LowActivityAlertTest(AlertGeneratorFixtureMixin, TestCase):
+    """Test low activity alert generation."""
+
+    alert_settings = {'alert_low_activity': True, 'alert_low_activity_days': 3}
+
     def test_generates_alert_after_threshold(self):
         """Test that alert is generated after inactivity threshold."""
         # Create study session 4 days ago
@@ -126,13 +136,13 @@ class LowActivityAlertTest(TestCase):
             user=self.student_user,
             subject=self.subject,
             hours_spent=2.0,
-            session_date=date.today() - timedelta(days=4)
+            session_date=self.today - timedelta(days=4)
         )
 
         alerts_created = generate_low_activity_alerts()
 
         self.assertEqual(alerts_created, 1)
-        alert = ProgressAlert.objects.first()
+        alert = ProgressAlert.objects.get()
         self.assertEqual(alert.alert_type, 'low_activity')
         self.assertEqual(alert.severity, 'warning')
 
@@ -142,7 +152,7 @@ class LowActivityAlertTest(TestCase):
             user=self.student_user,
             subject=self.subject,
             hours_spent=2.0,
-            session_date=date.today() - timedelta(days=1)
+            session_date=self.today - timedelta(days=1)
         )
 
         alerts_created = generate_low_activity_alerts()
@@ -155,44 +165,20 @@ class LowActivityAlertTest(TestCase):
             user=self.student_user,
             subject=self.subject,
             hours_spent=2.0,
-            session_date=date.today() - timedelta(days=5)
+            session_date=self.today - timedelta(days=5)
         )
 
         # Generate alert first time
-        generate_low_activity_alerts()
-        self.assertEqual(ProgressAlert.objects.count(), 1)
+        self.assertEqual(generate_low_activity_alerts(), 1)
 
         # Try to generate again
-        generate_low_activity_alerts()
-        self.assertEqual(ProgressAlert.objects.count(), 1) # Still just 1
+        self.assertEqual(generate_low_activity_alerts(), 0) # Nothing new
 
 
-class GoalAtRiskAlertTest(TestCase):
+class GoalAtRiskAlertTest(AlertGeneratorFixtureMixin, TestCase):
     """Test goal at risk alert generation."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
-
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One',
-            alert_goal_at_risk=True,
-            alert_goal_at_risk_days=7
-        )
-        self.parent_profile.linked_students.add(self.student_user)
-
-        self.subject = Subject.objects.create(
-            user=self.student_user,
-            name='maths'
-        )
+    alert_settings = {'alert_goal_at_risk': True, 'alert_goal_at_risk_days': 7}
 
     def test_generates_alert_for_at_risk_goal(self):
         """Test alert generated for goal with approaching deadline."""
@@ -202,58 +188,44 @@ class GoalAtRiskAlertTest(TestCase):
             term='spring_2026',
             current_level=4,
             target_level=7,
-            deadline=date.today() + timedelta(days=5)
+            deadline=self.today + timedelta(days=5)
         )
 
         alerts_created = generate_goal_at_risk_alerts()
 
         # Should create alert (deadline < 7 days, progress < 50%)
-        self.assertGreaterEqual(alerts_created, 0)
+        self.assertEqual(alerts_created, 1)
+        self.assertEqual(
+            ProgressAlert.objects.filter(alert_type='goal_at_risk').count(), 1
+        )
 
 
-class MilestoneAlertTest(TestCase):
+class MilestoneAlertTest(AlertGeneratorFixtureMixin, TestCase):
     """Test milestone achievement alert generation."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
+    alert_settings = {'alert_milestones': True}
 
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One',
-            alert_milestones=True
-        )
-        self.parent_profile.linked_students.add(self.student_user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
-        self.subject = Subject.objects.create(
-            user=self.student_user,
-            name='maths'
-        )
-
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level=5,
             target_level=7,
-            deadline=date.today() + timedelta(days=90)
+            deadline=cls.today + timedelta(days=90)
         )
 
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
             is_active=True
         )
 
-        self.step = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
+        cls.step = RoadmapStep.objects.create(
+            roadmap=cls.roadmap,
             order_number=1,
             title='Step 1',
             category='weakness',
@@ -262,86 +234,69 @@ class MilestoneAlertTest(TestCase):
         )
 
         # Create 4 tasks
-        for i in range(4):
-            ChecklistItem.objects.create(
-                roadmap_step=self.step,
+        ChecklistItem.objects.bulk_create([
+            ChecklistItem(
+                roadmap_step=cls.step,
                 task_description=f'Task {i+1}'
             )
+            for i in range(4)
+        ])
 
     def test_generates_alert_at_25_percent(self):
         """Test alert generated at 25% milestone."""
         # Complete 1 out of 4 tasks (25%)
-        item = ChecklistItem.objects.first()
-        item.is_completed = True
-        item.completed_at = timezone.now()
-        item.save()
+        item = self.step.checklist_items.first()
+        ChecklistItem.objects.filter(pk=item.pk).update(
+            is_completed=True,
+            completed_at=self.now
+        )
 
         alerts_created = generate_milestone_alerts()
 
-        self.assertGreaterEqual(alerts_created, 0)
+        self.assertEqual(alerts_created, 1)
 
     def test_no_duplicate_milestone_alerts(self):
         """Test that milestone alerts are not duplicated."""
         # Complete 1 task
-        item = ChecklistItem.objects.first()
-        item.is_completed = True
-        item.completed_at = timezone.now()
-        item.save()
+        item = self.step.checklist_items.first()
+        ChecklistItem.objects.filter(pk=item.pk).update(
+            is_completed=True,
+            completed_at=self.now
+        )
 
         # Generate once
-        generate_milestone_alerts()
-        count1 = ProgressAlert.objects.filter(alert_type='milestone_achieved').count()
+        self.assertEqual(generate_milestone_alerts(), 1)
 
         # Generate again
-        generate_milestone_alerts()
-        count2 = ProgressAlert.objects.filter(alert_type='milestone_achieved').count()
-
-        self.assertEqual(count1, count2) # Should not increase
+        self.assertEqual(generate_milestone_alerts(), 0) # Should not increase
 
 
-class RoadmapCompletedAlertTest(TestCase):
+class RoadmapCompletedAlertTest(AlertGeneratorFixtureMixin, TestCase):
     """Test roadmap completed alert generation."""
 
-    def setUp(self):
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
+    alert_settings = {'alert_roadmap_completed': True}
 
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
-            role='parent',
-            full_name='Parent One',
-            alert_roadmap_completed=True
-        )
-        self.parent_profile.linked_students.add(self.student_user)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
-        self.subject= Subject.objects.create(
-            user=self.student_user,
-            name='maths'
-        )
-
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level=5,
             target_level=7,
-            deadline=date.today() + timedelta(days=90)
+            deadline=cls.today + timedelta(days=90)
         )
 
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
             is_active=True
         )
 
-        self.step = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
+        cls.step = RoadmapStep.objects.create(
+            roadmap=cls.roadmap,
             order_number=1,
             title='Step 1',
             category='weakness',
@@ -349,56 +304,54 @@ class RoadmapCompletedAlertTest(TestCase):
             estimated_hours=5
         )
 
-        self.item = ChecklistItem.objects.create(
-            roadmap_step=self.step,
+        cls.item = ChecklistItem.objects.create(
+            roadmap_step=cls.step,
             task_description='Task 1'
         )
 
     def test_generates_alert_on_completion(self):
         """Test alert generated when roadmap 100% complete."""
         # Complete the task
-        self.item.is_completed = True
-        self.item.completed_at = timezone.now()
-        self.item.save()
+        ChecklistItem.objects.filter(pk=self.item.pk).update(
+            is_completed=True,
+            completed_at=self.now
+        )
 
         alert_created = generate_roadmap_completed_alerts()
 
-        self.assertGreaterEqual(alert_created, 0)
+        self.assertEqual(alert_created, 1)
 
 
 class AlertHistoryViewTest(TestCase):
     """Test alert history view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_user = User.objects.create_user(username='parent1')
+        cls.student_user = User.objects.create_user(username='student1')
 
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
+        cls.parent_profile = UserProfile.objects.create(
+            user=cls.parent_user,
             role='parent',
             full_name='Parent One'
         )
-        self.parent_profile.linked_students.add(self.student_user)
+        cls.parent_profile.linked_students.add(cls.student_user)
 
         # Create some alerts
-        for i in range(3):
-            ProgressAlert.objects.create(
-                parent=self.parent_user,
-                student=self.student_user,
+        ProgressAlert.objects.bulk_create([
+            ProgressAlert(
+                parent=cls.parent_user,
+                student=cls.student_user,
                 alert_type='low_activity',
                 severity='warning',
                 title=f'Alert {i+1}',
                 message=f'Message {i+1}'
             )
+            for i in range(3)
+        ])
 
-        self.url = reverse('tracker:parent_alert_history')
+        cls.url = ALERT_HISTORY_URL
+        cls.rf = RequestFactory()
 
     def test_requires_login(self):
         """Test that alert history requires login."""
@@ -407,7 +360,7 @@ class AlertHistoryViewTest(TestCase):
 
     def test_parent_can_access(self):
         """Test that parent can access alert history."""
-        self.client.login(username='parent1', password='testpass123')
+        self.client.force_login(self.parent_user)
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
@@ -415,8 +368,10 @@ class AlertHistoryViewTest(TestCase):
 
     def test_displays_alerts(self):
         """Test that alerts are displayed."""
-        self.client.login(username='parent1', password='testpass123')
-        response = self.client.get(self.url)
+        request = self.rf.get(self.url)
+        request.user = self.parent_user
+        with self.assertNumQueries(4):
+            response = parent_alert_history(request)
 
         self.assertContains(response, 'Alert 1')
         self.assertContains(response, 'Alert 2')
@@ -434,8 +389,10 @@ class AlertHistoryViewTest(TestCase):
             message='50% done'
         )
 
-        self.client.login(username='parent1', password='testpass123')
-        response = self.client.get(self.url + '?type=milestone_achieved')
+        request = self.rf.get(self.url, {'type': 'milestone_achieved'})
+        request.user = self.parent_user
+        with self.assertNumQueries(4):
+            response = parent_alert_history(request)
 
         self.assertContains(response, 'Milestone')
         self.assertNotContains(response, 'Alert 1')
@@ -444,27 +401,21 @@ class AlertHistoryViewTest(TestCase):
 class MarkAlertReadTest(TestCase):
     """Test marking alerts as read."""
 
-    def setUp(self):
-        self.client = Client()
-        self.parent_user = User.objects.create_user(
-            username='parent1',
-            password='testpass123'
-        )
-        self.student_user = User.objects.create_user(
-            username='student1',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_user = User.objects.create_user(username='parent1')
+        cls.student_user = User.objects.create_user(username='student1')
         
-        self.parent_profile = UserProfile.objects.create(
-            user=self.parent_user,
+        cls.parent_profile = UserProfile.objects.create(
+            user=cls.parent_user,
             role='parent',
             full_name='Parent One'
         )
-        self.parent_profile.linked_students.add(self.student_user)
+        cls.parent_profile.linked_students.add(cls.student_user)
 
-        self.alert = ProgressAlert.objects.create(
-            parent=self.parent_user,
-            student=self.student_user,
+        cls.alert = ProgressAlert.objects.create(
+            parent=cls.parent_user,
+            student=cls.student_user,
             alert_type='low_activity',
             severity='warning',
             title='Test',
@@ -473,7 +424,7 @@ class MarkAlertReadTest(TestCase):
 
     def test_mark_single_alert_read(self):
         """Test marking single alert as read."""
-        self.client.login(username='parent1', password='testpass123')
+        self.client.force_login(self.parent_user)
         url = reverse('tracker:mark_alert_read', args=[self.alert.id])
 
         response = self.client.post(url)
@@ -485,8 +436,8 @@ class MarkAlertReadTest(TestCase):
     def test_mark_all_alerts_read(self):
         """Test marking all alerts as read."""
         # Create more alerts
-        for i in range(3):
-            ProgressAlert.objects.create(
+        ProgressAlert.objects.bulk_create([
+            ProgressAlert(
                 parent=self.parent_user,
                 student=self.student_user,
                 alert_type='low_activity',
@@ -494,14 +445,16 @@ class MarkAlertReadTest(TestCase):
                 title=f'Alert {i}',
                 message=f'Message {i}'
             )
+            for i in range(3)
+        ])
 
-        self.client.login(username='parent1', password='testpass123')
-        url = reverse('tracker:mark_all_alerts_read')
+        self.client.force_login(self.parent_user)
+        url = MARK_ALL_ALERTS_READ_URL
 
         response = self.client.post(
             url,
             content_type='application/json',
-            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+            headers={'x-requested-with': 'XMLHttpRequest'}
         )
 
         self.assertEqual(response.status_code, 200)
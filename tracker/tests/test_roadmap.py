@@ -10,124 +10,146 @@ Tests cover:
 - Error handling
 """
 
-from django.test import TestCase, Client
+from django.test import RequestFactory, SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from django.urls import reverse
 from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 from datetime import date, timedelta
 import json
 
 from tracker.models import (
-    Subject, Feedback, TermGoal, Roadmap, 
+    Subject, TermGoal, Roadmap, 
     RoadmapStep, ChecklistItem
 )
 from tracker.ai_service import AIRoadmapService, RoadmapGenerationError
+from tracker.views import roadmap_detail, roadmap_step_detail, delete_roadmap
 
 
-class AIServiceTests(TestCase):
+# Claude API response payloads, built once at import
+# Valid roadmap with 4 steps (minimum required)
+SAMPLE_ROADMAP_JSON = json.dumps({
+    "title": "Mathematics Grade 5 → 7 Plan",
+    "overview": "A comprehensive study plan",
+    "steps": [
+        {
+            "order": 1,
+            "title": "Master Algebra Basics",
+            "description": "Build strong foundation in algebra",
+            "category": "strength",
+            "difficulty": "medium",
+            "estimated_hours": 8,
+            "checklist": [
+                "Complete 20 practice problems",
+                "Review key concepts",
+                "Take practice quiz"
+            ]
+        },
+        {
+            "order": 2,
+            "title": "Improve Geometry Skills",
+            "description": "Focus on geometric proofs",
+            "category": "weakness",
+            "difficulty": "hard",
+            "estimated_hours": 12,
+            "checklist": [
+                "Study angle relationships",
+                "Practice 15 proofs",
+                "Complete geometry worksheet"
+            ]
+        },
+        {
+            "order": 3,
+            "title": "Number Theory Practice",
+            "description": "Master fractions and decimals",
+            "category": "weakness",
+            "difficulty": "medium",
+            "estimated_hours": 10,
+            "checklist": [
+                "Practice fraction operations",
+                "Complete decimal exercises",
+                "Take assessment"
+            ]
+        },
+        {
+            "order": 4,
+            "title": "Statistics Fundamentals",
+            "description": "Learn data analysis basics",
+            "category": "level_up",
+            "difficulty": "easy",
+            "estimated_hours": 6,
+            "checklist": [
+                "Study mean/median/mode",
+                "Create data visualizations",
+                "Complete statistics worksheet"
+            ]
+        }
+    ]
+})
+
+# Missing overview, empty steps
+INVALID_ROADMAP_JSON = json.dumps({
+    "title": "Test",
+    "steps": []
+})
+
+# Parsed roadmap returned by the mocked AI service
+GENERATED_ROADMAP = {
+    'title': 'Test Roadmap',
+    'overview': 'Test overview',
+    'steps': [
+        {
+            'order': 1,
+            'title': 'Step 1',
+            'description': 'Description',
+            'category': 'weakness',
+            'difficulty': 'medium',
+            'estimated_hours': 8,
+            'checklist': ['Task 1', 'Task 2', 'Task 3']
+        }
+    ]
+}
+
+
+class NoNetworkMixin:
+    """Fail fast if a test reaches the real Claude API instead of a mock"""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Block DNS lookups as well as connections, so nothing waits on a timeout
+        for target in ('socket.socket', 'socket.getaddrinfo'):
+            patcher = patch(
+                target,
+                side_effect=RuntimeError('Network access is blocked in tests')
+            )
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+
+class AIServiceTests(NoNetworkMixin, SimpleTestCase):
     """Test the AI service functionality"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        
-        self.subject = Subject.objects.create(
-            user=self.user,
-            name='maths',
-            description='Test subject'
-        )
-        
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
-            term='spring_2026',
-            current_level='Grade 5',
-            target_level='Grade 7',
-            deadline=date.today() + timedelta(days=90)
-        )
-        
-        self.feedback = Feedback.objects.create(
-            subject=self.subject,
-            feedback_date=date.today(),
-            strengths='Good at algebra',
-            weaknesses='Struggles with geometry',
-            areas_to_improve='Practice more proofs'
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Patch the Anthropic client once for every test in the class"""
+        super().setUpClass()
+        patcher = patch('tracker.ai_service.anthropic.Anthropic')
+        cls.mock_anthropic = patcher.start()
+        cls.addClassCleanup(patcher.stop)
     
-    @patch('tracker.ai_service.anthropic.Anthropic')
-    def test_ai_service_initialization(self, mock_anthropic):
+    def test_ai_service_initialization(self):
         """Test AI service initializes correctly"""
         service = AIRoadmapService()
         self.assertIsNotNone(service.client)
         self.assertEqual(service.model, 'claude-sonnet-4-20250514')
     
-    @patch('tracker.ai_service.anthropic.Anthropic')
-    def test_generate_roadmap_success(self, mock_anthropic):
+    def test_generate_roadmap_success(self):
         """Test successful roadmap generation"""
         # Mock API response with 4 steps (minimum required)
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text=json.dumps({
-            "title": "Mathematics Grade 5 → 7 Plan",
-            "overview": "A comprehensive study plan",
-            "steps": [
-                {
-                    "order": 1,
-                    "title": "Master Algebra Basics",
-                    "description": "Build strong foundation in algebra",
-                    "category": "strength",
-                    "difficulty": "medium",
-                    "estimated_hours": 8,
-                    "checklist": [
-                        "Complete 20 practice problems",
-                        "Review key concepts",
-                        "Take practice quiz"
-                    ]
-                },
-                {
-                    "order": 2,
-                    "title": "Improve Geometry Skills",
-                    "description": "Focus on geometric proofs",
-                    "category": "weakness",
-                    "difficulty": "hard",
-                    "estimated_hours": 12,
-                    "checklist": [
-                        "Study angle relationships",
-                        "Practice 15 proofs",
-                        "Complete geometry worksheet"
-                    ]
-                },
-                {
-                    "order": 3,
-                    "title": "Number Theory Practice",
-                    "description": "Master fractions and decimals",
-                    "category": "weakness",
-                    "difficulty": "medium",
-                    "estimated_hours": 10,
-                    "checklist": [
-                        "Practice fraction operations",
-                        "Complete decimal exercises",
-                        "Take assessment"
-                    ]
-                },
-                {
-                    "order": 4,
-                    "title": "Statistics Fundamentals",
-                    "description": "Learn data analysis basics",
-                    "category": "level_up",
-                    "difficulty": "easy",
-                    "estimated_hours": 6,
-                    "checklist": [
-                        "Study mean/median/mode",
-                        "Create data visualizations",
-                        "Complete statistics worksheet"
-                    ]
-                }
-            ]
-        }))]
+        mock_response = SimpleNamespace(content=[SimpleNamespace(text=SAMPLE_ROADMAP_JSON)])
         
-        mock_client = mock_anthropic.return_value
+        mock_client = self.mock_anthropic.return_value
         mock_client.messages.create.return_value = mock_response
         
         service = AIRoadmapService()
@@ -146,17 +168,12 @@ class AIServiceTests(TestCase):
         self.assertEqual(len(roadmap_data['steps']), 4)
         self.assertEqual(roadmap_data['steps'][0]['category'], 'strength')
     
-    @patch('tracker.ai_service.anthropic.Anthropic')
-    def test_generate_roadmap_validation(self, mock_anthropic):
+    def test_generate_roadmap_validation(self):
         """Test roadmap validation catches invalid data"""
         # Mock invalid response (missing required fields)
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text=json.dumps({
-            "title": "Test",
-            "steps": []  # Missing overview, empty steps
-        }))]
+        mock_response = SimpleNamespace(content=[SimpleNamespace(text=INVALID_ROADMAP_JSON)])
         
-        mock_client = mock_anthropic.return_value
+        mock_client = self.mock_anthropic.return_value
         mock_client.messages.create.return_value = mock_response
         
         service = AIRoadmapService()
@@ -173,53 +190,43 @@ class AIServiceTests(TestCase):
             )
 
 
-class RoadmapGenerationViewTests(TestCase):
+class RoadmapGenerationViewTests(NoNetworkMixin, TestCase):
     """Test roadmap generation views"""
     
-    def setUp(self):
-        """Set up test data and client"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data"""
+        cls.user = User.objects.create_user(username='teststudent')
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths',
             description='Test subject'
         )
         
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level='Grade 5',
             target_level='Grade 7',
             deadline=date.today() + timedelta(days=90)
         )
+        
+        cls.generate_url = reverse('tracker:generate_roadmap', kwargs={'subject_pk': cls.subject.pk})
+    
+    def setUp(self):
+        """Log in the test client"""
+        self.client.force_login(self.user)
     
     def test_generate_roadmap_get(self):
         """Test GET request shows confirmation page"""
-        response = self.client.get(
-            reverse('tracker:generate_roadmap', kwargs={'subject_pk': self.subject.pk})
-        )
+        response = self.client.get(self.generate_url)
         
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'tracker/roadmap_generate.html')
         self.assertContains(response, 'Generate AI Roadmap')
         self.assertContains(response, self.subject.get_name_display())
     
-    def test_generate_roadmap_requires_login(self):
-        """Test generation requires authentication"""
-        self.client.logout()
-        response = self.client.get(
-            reverse('tracker:generate_roadmap', kwargs={'subject_pk': self.subject.pk})
-        )
-        
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response.url.startswith('/accounts/login/'))
-    
     def test_generate_roadmap_requires_term_goal(self):
         """Test generation requires term goal"""
         # Create subject without term goal
@@ -241,43 +248,27 @@ class RoadmapGenerationViewTests(TestCase):
         """Test successful roadmap generation via POST"""
         # Mock AI service
         mock_service = MagicMock()
-        mock_service.generate_roadmap.return_value = {
-            'title': 'Test Roadmap',
-            'overview': 'Test overview',
-            'steps': [
-                {
-                    'order': 1,
-                    'title': 'Step 1',
-                    'description': 'Description',
-                    'category': 'weakness',
-                    'difficulty': 'medium',
-                    'estimated_hours': 8,
-                    'checklist': ['Task 1', 'Task 2', 'Task 3']
-                }
-            ]
-        }
+        mock_service.generate_roadmap.return_value = GENERATED_ROADMAP
         mock_get_service.return_value = mock_service
         
-        response = self.client.post(
-            reverse('tracker:generate_roadmap', kwargs={'subject_pk': self.subject.pk})
-        )
+        response = self.client.post(self.generate_url)
         
         # Should redirect to roadmap detail
         self.assertEqual(response.status_code, 302)
         
-        # Verify roadmap was created
-        roadmap = Roadmap.objects.filter(subject=self.subject).first()
-        self.assertIsNotNone(roadmap)
+        # Verify roadmap was created (steps and items loaded alongside it)
+        roadmap = Roadmap.objects.prefetch_related('steps__checklist_items').get(
+            subject=self.subject
+        )
         self.assertEqual(roadmap.title, 'Test Roadmap')
         self.assertEqual(roadmap.total_steps, 1)
         
         # Verify steps were created
-        steps = RoadmapStep.objects.filter(roadmap=roadmap)
-        self.assertEqual(steps.count(), 1)
+        steps = roadmap.steps.all()
+        self.assertEqual(len(steps), 1)
         
         # Verify checklist items were created
-        checklist = ChecklistItem.objects.filter(roadmap_step=steps.first())
-        self.assertEqual(checklist.count(), 3)
+        self.assertEqual(len(steps[0].checklist_items.all()), 3)
     
     @patch('tracker.views.get_ai_service')
     def test_generate_roadmap_deactivates_old(self, mock_get_service):
@@ -310,9 +301,7 @@ class RoadmapGenerationViewTests(TestCase):
         }
         mock_get_service.return_value = mock_service
         
-        self.client.post(
-            reverse('tracker:generate_roadmap', kwargs={'subject_pk': self.subject.pk})
-        )
+        self.client.post(self.generate_url)
         
         # Verify old roadmap is deactivated
         old_roadmap.refresh_from_db()
@@ -325,10 +314,7 @@ class RoadmapGenerationViewTests(TestCase):
     
     def test_cannot_generate_for_other_users_subject(self):
         """Test users cannot generate roadmaps for others' subjects"""
-        other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
+        other_user = User.objects.create_user(username='otheruser')
         other_subject = Subject.objects.create(
             user=other_user,
             name='science',
@@ -345,39 +331,35 @@ class RoadmapGenerationViewTests(TestCase):
 class RoadmapDetailViewTests(TestCase):
     """Test roadmap detail view"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
+        cls.user = User.objects.create_user(username='teststudent')
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths'
         )
         
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level='Grade 5',
             target_level='Grade 7',
             deadline=date.today() + timedelta(days=90)
         )
         
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
             overview='Test overview',
             total_steps=2,
             is_active=True
         )
         
-        self.step1 = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
+        cls.step1 = RoadmapStep.objects.create(
+            roadmap=cls.roadmap,
             order_number=1,
             title='Step 1',
             description='Description 1',
@@ -386,52 +368,45 @@ class RoadmapDetailViewTests(TestCase):
             estimated_hours=8
         )
         
-        ChecklistItem.objects.create(
-            roadmap_step=self.step1,
-            task_description='Task 1'
-        )
-        ChecklistItem.objects.create(
-            roadmap_step=self.step1,
-            task_description='Task 2',
-            is_completed=True
-        )
+        ChecklistItem.objects.bulk_create([
+            ChecklistItem(roadmap_step=cls.step1, task_description='Task 1'),
+            ChecklistItem(
+                roadmap_step=cls.step1,
+                task_description='Task 2',
+                is_completed=True
+            ),
+        ])
+        
+        cls.detail_url = reverse('tracker:roadmap_detail', kwargs={'pk': cls.roadmap.pk})
+        cls.rf = RequestFactory()
+    
+    def setUp(self):
+        """Log in the test client"""
+        self.client.force_login(self.user)
     
     def test_roadmap_detail_get(self):
         """Test viewing roadmap detail"""
-        response = self.client.get(
-            reverse('tracker:roadmap_detail', kwargs={'pk': self.roadmap.pk})
-        )
+        request = self.rf.get(self.detail_url)
+        request.user = self.user
+        with self.assertTemplateUsed('tracker/roadmap_detail.html'):
+            response = roadmap_detail(request, pk=self.roadmap.pk)
         
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'tracker/roadmap_detail.html')
         self.assertContains(response, 'Test Roadmap')
         self.assertContains(response, 'Step 1')
     
     def test_roadmap_detail_calculates_progress(self):
         """Test progress calculation in roadmap detail"""
-        response = self.client.get(
-            reverse('tracker:roadmap_detail', kwargs={'pk': self.roadmap.pk})
-        )
+        response = self.client.get(self.detail_url)
         
         # Should show 50% progress (1 of 2 items complete)
-        self.assertContains(response, '50')
-    
-    def test_roadmap_detail_requires_login(self):
-        """Test roadmap detail requires authentication"""
-        self.client.logout()
-        response = self.client.get(
-            reverse('tracker:roadmap_detail', kwargs={'pk': self.roadmap.pk})
-        )
-        
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response.url.startswith('/accounts/login/'))
+        self.assertEqual(response.context['completed_checklist_items'], 1)
+        self.assertEqual(response.context['total_checklist_items'], 2)
+        self.assertEqual(response.context['completion_percentage'], 50)
     
     def test_cannot_view_other_users_roadmap(self):
         """Test users cannot view others' roadmaps"""
-        other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
+        other_user = User.objects.create_user(username='otheruser')
         other_subject = Subject.objects.create(
             user=other_user,
             name='science'
@@ -460,37 +435,33 @@ class RoadmapDetailViewTests(TestCase):
 class RoadmapStepDetailViewTests(TestCase):
     """Test roadmap step detail view"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
+        cls.user = User.objects.create_user(username='teststudent')
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths'
         )
         
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level='Grade 5',
             target_level='Grade 7',
             deadline=date.today() + timedelta(days=90)
         )
         
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
             overview='Test overview'
         )
         
-        self.step = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
+        cls.step = RoadmapStep.objects.create(
+            roadmap=cls.roadmap,
             order_number=1,
             title='Test Step',
             description='Step description',
@@ -500,81 +471,79 @@ class RoadmapStepDetailViewTests(TestCase):
         )
         
         ChecklistItem.objects.create(
-            roadmap_step=self.step,
+            roadmap_step=cls.step,
             task_description='Task 1'
         )
+        
+        cls.step_url = reverse('tracker:roadmap_step_detail', kwargs={'pk': cls.step.pk})
+        cls.rf = RequestFactory()
+    
+    def setUp(self):
+        """Log in the test client"""
+        self.client.force_login(self.user)
     
     def test_step_detail_get(self):
         """Test viewing step detail"""
-        response = self.client.get(
-            reverse('tracker:roadmap_step_detail', kwargs={'pk': self.step.pk})
-        )
+        request = self.rf.get(self.step_url)
+        request.user = self.user
+        with self.assertTemplateUsed('tracker/roadmap_step_detail.html'):
+            response = roadmap_step_detail(request, pk=self.step.pk)
         
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'tracker/roadmap_step_detail.html')
         self.assertContains(response, 'Test Step')
         self.assertContains(response, 'Step description')
         self.assertContains(response, 'Task 1')
-    
-    def test_step_detail_requires_login(self):
-        """Test step detail requires authentication"""
-        self.client.logout()
-        response = self.client.get(
-            reverse('tracker:roadmap_step_detail', kwargs={'pk': self.step.pk})
-        )
-        
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response.url.startswith('/accounts/login/'))
 
 
 class RoadmapDeleteViewTests(TestCase):
     """Test roadmap deletion"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
+        cls.user = User.objects.create_user(username='teststudent')
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths'
         )
         
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level='Grade 5',
             target_level='Grade 7',
             deadline=date.today() + timedelta(days=90)
         )
         
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
             overview='Test overview'
         )
+        
+        cls.delete_url = reverse('tracker:delete_roadmap', kwargs={'pk': cls.roadmap.pk})
+        cls.rf = RequestFactory()
+    
+    def setUp(self):
+        """Log in the test client"""
+        self.client.force_login(self.user)
     
     def test_delete_roadmap_get(self):
         """Test GET shows confirmation page"""
-        response = self.client.get(
-            reverse('tracker:delete_roadmap', kwargs={'pk': self.roadmap.pk})
-        )
+        request = self.rf.get(self.delete_url)
+        request.user = self.user
+        with self.assertTemplateUsed('tracker/roadmap_confirm_delete.html'):
+            response = delete_roadmap(request, pk=self.roadmap.pk)
         
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'tracker/roadmap_confirm_delete.html')
         self.assertContains(response, 'Delete Roadmap')
         self.assertContains(response, 'Test Roadmap')
     
     def test_delete_roadmap_post(self):
         """Test POST deletes roadmap"""
-        response = self.client.post(
-            reverse('tracker:delete_roadmap', kwargs={'pk': self.roadmap.pk})
-        )
+        response = self.client.post(self.delete_url)
         
         # Should redirect to subject detail
         self.assertEqual(response.status_code, 302)
@@ -601,9 +570,7 @@ class RoadmapDeleteViewTests(TestCase):
             task_description='Task'
         )
         
-        self.client.post(
-            reverse('tracker:delete_roadmap', kwargs={'pk': self.roadmap.pk})
-        )
+        self.client.post(self.delete_url)
         
         # Verify cascade deletion
         self.assertFalse(RoadmapStep.objects.filter(pk=step.pk).exists())
@@ -611,10 +578,7 @@ class RoadmapDeleteViewTests(TestCase):
     
     def test_cannot_delete_other_users_roadmap(self):
         """Test users cannot delete others' roadmaps"""
-        other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
+        other_user = User.objects.create_user(username='otheruser')
         other_subject = Subject.objects.create(
             user=other_user,
             name='science'
@@ -642,4 +606,17 @@ class RoadmapDeleteViewTests(TestCase):
         # Verify roadmap was not deleted
         self.assertTrue(
             Roadmap.objects.filter(pk=other_roadmap.pk).exists()
-        )
\ No newline at end of file
+        )
+
+
+class RoadmapAuthTest(TestCase):
+    """Test that roadmap views require login (no fixtures needed)"""
+    
+    def test_roadmap_views_require_login(self):
+        """Test every roadmap view redirects anonymous users to login"""
+        # login_required redirects before the subject/roadmap/step is looked up
+        for name in ['generate_roadmap', 'roadmap_detail', 'roadmap_step_detail', 'delete_roadmap']:
+            with self.subTest(view=name):
+                response = self.client.get(reverse(f'tracker:{name}', args=[1]))
+                self.assertEqual(response.status_code, 302)
+                self.assertTrue(response.url.startswith('/accounts/login/'))
@@ -8,7 +8,7 @@ Tests cover:
 - JSON response format
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase, Client, RequestFactory
 from django.contrib.auth.models import User
 from django.urls import reverse
 from datetime import date, timedelta
@@ -18,108 +18,109 @@ from tracker.models import (
     Subject, TermGoal, Roadmap, 
     RoadmapStep, ChecklistItem
 )
+from tracker.views import toggle_checklist_item
 
+# Session + user lookup, item fetch, item update, step and roadmap counts:
+# constant however many items the roadmap has
+TOGGLE_QUERIES = 6
 
-class ToggleChecklistItemTests(TestCase):
-    """Test toggling checklist item completion"""
+
+class RoadmapFixtureMixin:
+    """Student with a maths term goal, an empty roadmap and a logged-in client"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='teststudent')
         
         # Create subject and term goal
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths'
         )
         
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
+        cls.term_goal = TermGoal.objects.create(
+            subject=cls.subject,
             term='spring_2026',
             current_level='Grade 5',
             target_level='Grade 7',
             deadline=date.today() + timedelta(days=90)
         )
         
-        # Create roadmap with steps
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
+        cls.roadmap = Roadmap.objects.create(
+            subject=cls.subject,
+            term_goal=cls.term_goal,
             title='Test Roadmap',
-            overview='Test overview',
-            total_steps=2
-        )
-        
-        self.step1 = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
-            order_number=1,
-            title='Step 1',
-            description='Description 1',
-            category='weakness',
-            difficulty='medium',
-            estimated_hours=8
-        )
-        
-        self.step2 = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
-            order_number=2,
-            title='Step 2',
-            description='Description 2',
-            category='strength',
-            difficulty='easy',
-            estimated_hours=5
-        )
-        
-        # Create checklist items for step 1
-        self.item1 = ChecklistItem.objects.create(
-            roadmap_step=self.step1,
-            task_description='Task 1'
-        )
-        self.item2 = ChecklistItem.objects.create(
-            roadmap_step=self.step1,
-            task_description='Task 2'
-        )
-        self.item3 = ChecklistItem.objects.create(
-            roadmap_step=self.step1,
-            task_description='Task 3'
+            overview='Test overview'
         )
         
-        # Create checklist items for step 2
-        self.item4 = ChecklistItem.objects.create(
-            roadmap_step=self.step2,
-            task_description='Task 4'
-        )
-        self.item5 = ChecklistItem.objects.create(
-            roadmap_step=self.step2,
-            task_description='Task 5'
-        )
+        cls.logged_in_client = Client()
+        cls.logged_in_client.force_login(cls.user)
+    
+    def setUp(self):
+        self.client = self.logged_in_client
+
+
+class ToggleChecklistItemTests(RoadmapFixtureMixin, TestCase):
+    """Test toggling checklist item completion"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data"""
+        super().setUpTestData()
+        
+        # Create roadmap steps
+        cls.step1, cls.step2 = RoadmapStep.objects.bulk_create([
+            RoadmapStep(
+                roadmap=cls.roadmap,
+                order_number=1,
+                title='Step 1',
+                description='Description 1',
+                category='weakness',
+                difficulty='medium',
+                estimated_hours=8
+            ),
+            RoadmapStep(
+                roadmap=cls.roadmap,
+                order_number=2,
+                title='Step 2',
+                description='Description 2',
+                category='strength',
+                difficulty='easy',
+                estimated_hours=5
+            ),
+        ])
+        
+        # Create checklist items: 3 for step 1, 2 for step 2
+        cls.item1, cls.item2, cls.item3, cls.item4, cls.item5 = ChecklistItem.objects.bulk_create([
+            ChecklistItem(roadmap_step=cls.step1, task_description='Task 1'),
+            ChecklistItem(roadmap_step=cls.step1, task_description='Task 2'),
+            ChecklistItem(roadmap_step=cls.step1, task_description='Task 3'),
+            ChecklistItem(roadmap_step=cls.step2, task_description='Task 4'),
+            ChecklistItem(roadmap_step=cls.step2, task_description='Task 5'),
+        ])
+        
+        cls.item1_url, cls.item2_url, cls.item4_url = (
+            reverse('tracker:toggle_checklist_item', kwargs={'pk': item.pk})
+            for item in (cls.item1, cls.item2, cls.item4)
+        )
+        cls.rf = RequestFactory()
     
     def test_toggle_item_to_completed(self):
         """Test marking an item as completed"""
         self.assertFalse(self.item1.is_completed)
         self.assertIsNone(self.item1.completed_at)
         
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        request = self.rf.post(self.item1_url)
+        request.user = self.user
+        response = toggle_checklist_item(request, pk=self.item1.pk)
         
         self.assertEqual(response.status_code, 200)
         
         # Parse JSON response
-        data = response.json()
+        data = json.loads(response.content)
         self.assertTrue(data['success'])
         self.assertTrue(data['is_completed'])  # Fixed: was 'item_completed'
         self.assertIsNotNone(data['completed_at'])
-        
-        # Verify database was updated
-        self.item1.refresh_from_db()
-        self.assertTrue(self.item1.is_completed)
-        self.assertIsNotNone(self.item1.completed_at)
     
     def test_toggle_item_to_incomplete(self):
         """Test unmarking a completed item"""
@@ -127,31 +128,36 @@ class ToggleChecklistItemTests(TestCase):
         self.item1.is_completed = True
         self.item1.save()
         
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        request = self.rf.post(self.item1_url)
+        request.user = self.user
+        response = toggle_checklist_item(request, pk=self.item1.pk)
         
         self.assertEqual(response.status_code, 200)
         
         # Parse JSON response
-        data = response.json()
+        data = json.loads(response.content)
         self.assertTrue(data['success'])
         self.assertFalse(data['is_completed'])
         self.assertIsNone(data['completed_at'])
+    
+    def test_db_persists_toggle(self):
+        """Test the toggled state is saved to the database"""
+        request = self.rf.post(self.item1_url)
+        request.user = self.user
+        toggle_checklist_item(request, pk=self.item1.pk)
         
-        # Verify database was updated
         self.item1.refresh_from_db()
-        self.assertFalse(self.item1.is_completed)
-        self.assertIsNone(self.item1.completed_at)
+        self.assertTrue(self.item1.is_completed)
+        self.assertIsNotNone(self.item1.completed_at)
     
     def test_calculates_step_progress(self):
         """Test step progress calculation"""
         # Mark 1 of 3 items complete in step 1
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        request = self.rf.post(self.item1_url)
+        request.user = self.user
+        response = toggle_checklist_item(request, pk=self.item1.pk)
         
-        data = response.json()
+        data = json.loads(response.content)
         self.assertEqual(data['step_completed'], 1)
         self.assertEqual(data['step_total'], 3)
         self.assertAlmostEqual(data['step_progress'], 33.3, places=1)
@@ -160,12 +166,10 @@ class ToggleChecklistItemTests(TestCase):
         """Test roadmap overall progress calculation"""
         # Total: 5 items (3 in step1, 2 in step2)
         # Mark 2 items complete
-        self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item4.pk})
-        )
+        with self.assertNumQueries(TOGGLE_QUERIES):
+            self.client.post(self.item1_url)
+        with self.assertNumQueries(TOGGLE_QUERIES):
+            response = self.client.post(self.item4_url)
         
         data = response.json()
         self.assertEqual(data['roadmap_completed'], 2)
@@ -174,20 +178,14 @@ class ToggleChecklistItemTests(TestCase):
     
     def test_requires_authentication(self):
         """Test toggle requires login"""
-        self.client.logout()
-        
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        response = Client().post(self.item1_url)
         
         self.assertEqual(response.status_code, 302)
         self.assertTrue(response.url.startswith('/accounts/login/'))
     
     def test_requires_post_method(self):
         """Test endpoint only accepts POST"""
-        response = self.client.get(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        response = self.client.get(self.item1_url)
         
         # Should return 405 Method Not Allowed
         self.assertEqual(response.status_code, 405)
@@ -195,10 +193,7 @@ class ToggleChecklistItemTests(TestCase):
     def test_cannot_toggle_other_users_items(self):
         """Test users cannot toggle other users' checklist items"""
         # Create another user's roadmap
-        other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
+        other_user = User.objects.create_user(username='otheruser')
         other_subject = Subject.objects.create(
             user=other_user,
             name='science'
@@ -249,64 +244,37 @@ class ToggleChecklistItemTests(TestCase):
         # Total: 5 items
         
         # Check item 1 (step 1) - 1/5 = 20%
-        response1 = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        with self.assertNumQueries(TOGGLE_QUERIES):
+            response1 = self.client.post(self.item1_url)
         data1 = response1.json()
         self.assertEqual(data1['roadmap_progress'], 20.0)
         self.assertAlmostEqual(data1['step_progress'], 33.3, places=1)  # Fixed: was exact 33.33
         
         # Check item 2 (step 1) - 2/5 = 40%
-        response2 = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item2.pk})
-        )
+        with self.assertNumQueries(TOGGLE_QUERIES):
+            response2 = self.client.post(self.item2_url)
         data2 = response2.json()
         self.assertEqual(data2['roadmap_progress'], 40.0)
         self.assertAlmostEqual(data2['step_progress'], 66.7, places=1)  # Fixed: was exact 66.7
         
         # Check item 4 (step 2) - 3/5 = 60%
-        response3 = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item4.pk})
-        )
+        with self.assertNumQueries(TOGGLE_QUERIES):
+            response3 = self.client.post(self.item4_url)
         data3 = response3.json()
         self.assertEqual(data3['roadmap_progress'], 60.0)
         self.assertEqual(data3['step_progress'], 50.0)  # 1/2 in step 2
 
 
-class ProgressCalculationTests(TestCase):
+class ProgressCalculationTests(RoadmapFixtureMixin, TestCase):
     """Test progress calculation edge cases"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='teststudent',
-            password='testpass123'
-        )
-        self.client.login(username='teststudent', password='testpass123')
-        
-        self.subject = Subject.objects.create(
-            user=self.user,
-            name='maths'
-        )
-        
-        self.term_goal = TermGoal.objects.create(
-            subject=self.subject,
-            term='spring_2026',
-            current_level='Grade 5',
-            target_level='Grade 7',
-            deadline=date.today() + timedelta(days=90)
-        )
-        
-        self.roadmap = Roadmap.objects.create(
-            subject=self.subject,
-            term_goal=self.term_goal,
-            title='Test Roadmap',
-            overview='Test overview'
-        )
+        super().setUpTestData()
         
-        self.step = RoadmapStep.objects.create(
-            roadmap=self.roadmap,
+        cls.step = RoadmapStep.objects.create(
+            roadmap=cls.roadmap,
             order_number=1,
             title='Step 1',
             description='Description',
@@ -315,24 +283,21 @@ class ProgressCalculationTests(TestCase):
             estimated_hours=8
         )
         
-        self.item1 = ChecklistItem.objects.create(
-            roadmap_step=self.step,
-            task_description='Task 1'
-        )
-        self.item2 = ChecklistItem.objects.create(
-            roadmap_step=self.step,
-            task_description='Task 2'
+        cls.item1, cls.item2 = ChecklistItem.objects.bulk_create([
+            ChecklistItem(roadmap_step=cls.step, task_description='Task 1'),
+            ChecklistItem(roadmap_step=cls.step, task_description='Task 2'),
+        ])
+        
+        cls.item1_url, cls.item2_url = (
+            reverse('tracker:toggle_checklist_item', kwargs={'pk': item.pk})
+            for item in (cls.item1, cls.item2)
         )
     
     def test_all_items_completed(self):
         """Test progress when all items are completed"""
         # Complete both items
-        self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item2.pk})
-        )
+        self.client.post(self.item1_url)
+        response = self.client.post(self.item2_url)
         
         data = response.json()
         self.assertEqual(data['roadmap_progress'], 100.0)
@@ -341,17 +306,11 @@ class ProgressCalculationTests(TestCase):
     def test_unchecking_updates_progress(self):
         """Test progress decreases when items are unchecked"""
         # Check both items
-        self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
-        self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item2.pk})
-        )
+        self.client.post(self.item1_url)
+        self.client.post(self.item2_url)
         
         # Uncheck one item
-        response = self.client.post(
-            reverse('tracker:toggle_checklist_item', kwargs={'pk': self.item1.pk})
-        )
+        response = self.client.post(self.item1_url)
         
         data = response.json()
         self.assertEqual(data['roadmap_progress'], 50.0)
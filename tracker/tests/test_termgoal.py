@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from datetime import date, timedelta
@@ -69,7 +69,7 @@ class TermGoalModelTest(TestCase):
         self.assertEqual(str(term_goal), expected)
 
 
-class TermGoalFormTest(TestCase):
+class TermGoalFormTest(SimpleTestCase):
     """Test the TermGoalForm"""
 
     def test_form_valid_data(self):
@@ -105,18 +105,21 @@ class TermGoalFormTest(TestCase):
 class TermGoalViewTest(TestCase):
     """Test term goal views"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths',
             description='Mathematics'
         )
 
+    def setUp(self):
+        self.client = Client()
+
     def test_add_term_goal_requires_login(self):
         """Test that adding term goal requires authentication"""
         url = reverse('tracker:add_term_goal', args=[self.subject.pk])
@@ -9,22 +9,25 @@ from django.contrib.messages import get_messages
 class DashboardViewTest(TestCase):
     """Test cases for the dashboard view"""
     
-    def setUp(self):
-        """Set up test data before each test"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.dashboard_url = reverse('tracker:dashboard')
+        cls.dashboard_url = reverse('tracker:dashboard')
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_dashboard_requires_login(self):
         """Test that dashboard redirects to login if not authenticated"""
@@ -78,22 +81,25 @@ class DashboardViewTest(TestCase):
 class AddSubjectViewTest(TestCase):
     """Test cases for the add subject view"""
     
-    def setUp(self):
-        """Set up test data before each test"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.add_subject_url = reverse('tracker:add_subject')
+        cls.add_subject_url = reverse('tracker:add_subject')
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_add_subject_requires_login(self):
         """Test that add subject requires authentication"""
@@ -193,28 +199,31 @@ class AddSubjectViewTest(TestCase):
 class SubjectDetailViewTest(TestCase):
     """Test cases for the subject detail view"""
     
-    def setUp(self):
-        """Set up test data before each test"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='science',
             description='Science subject'
         )
         
-        self.detail_url = reverse('tracker:subject_detail', args=[self.subject.pk])
+        cls.detail_url = reverse('tracker:subject_detail', args=[cls.subject.pk])
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_subject_detail_requires_login(self):
         """Test that subject detail requires authentication"""
@@ -257,28 +266,31 @@ class SubjectDetailViewTest(TestCase):
 class EditSubjectViewTest(TestCase):
     """Test cases for the edit subject view"""
     
-    def setUp(self):
-        """Set up test data before each test"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='maths',
             description='Original description'
         )
         
-        self.edit_url = reverse('tracker:edit_subject', args=[self.subject.pk])
+        cls.edit_url = reverse('tracker:edit_subject', args=[cls.subject.pk])
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_edit_subject_requires_login(self):
         """Test that edit subject requires authentication"""
@@ -334,28 +346,31 @@ class EditSubjectViewTest(TestCase):
 class DeleteSubjectViewTest(TestCase):
     """Test cases for the delete subject view"""
     
-    def setUp(self):
-        """Set up test data before each test"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         UserProfile.objects.create(
-            user=self.user,
+            user=cls.user,
             role='student',
             full_name='Test Student',
             year_group=9
         )
         
-        self.subject = Subject.objects.create(
-            user=self.user,
+        cls.subject = Subject.objects.create(
+            user=cls.user,
             name='english',
             description='English subject'
         )
         
-        self.delete_url = reverse('tracker:delete_subject', args=[self.subject.pk])
+        cls.delete_url = reverse('tracker:delete_subject', args=[cls.subject.pk])
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_delete_subject_requires_login(self):
         """Test that delete subject requires authentication"""
@@ -134,20 +134,21 @@ def calculate_study_streak(user):
     streak = 0
     current_date = today
 
-    while True:
-        # Check if there are study sessions on current_date
-        has_session = StudySession.objects.filter(
-            subject__user=user,
-            session_date=current_date
-        ).exists()
+    # Fetch each distinct study date once (newest first) rather than
+    # querying day by day
+    session_dates = StudySession.objects.filter(
+        subject__user=user,
+        session_date__lte=today
+    ).order_by('-session_date').values_list('session_date', flat=True).distinct()
 
-        if has_session:
-            streak += 1
-            current_date -= timedelta(days=1)
-        else:
+    for session_date in session_dates:
+        if session_date != current_date:
             # Streak broken
             break
 
+        streak += 1
+        current_date -= timedelta(days=1)
+
         # Safety limit
         if streak > 365:
             break
@@ -757,22 +758,28 @@ def toggle_checklist_item(request, pk):
     else:
         checklist_item.completed_at = None
 
-    checklist_item.save()
+    checklist_item.save(update_fields=['is_completed', 'completed_at'])
 
-    # Calculate step progress
+    # Calculate step progress (completed and total counts in one query)
     step = checklist_item.roadmap_step
-    step_items = step.checklist_items.all()
-    step_completed = step_items.filter(is_completed=True).count()
-    step_total = step_items.count()
+    step_counts = step.checklist_items.aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(is_completed=True))
+    )
+    step_completed = step_counts['completed']
+    step_total = step_counts['total']
     step_progress = (step_completed / step_total * 100) if step_total > 0 else 0
 
     # Calculate roadmap progress
     roadmap = step.roadmap
-    all_items = ChecklistItem.objects.filter(
+    roadmap_counts = ChecklistItem.objects.filter(
         roadmap_step__roadmap=roadmap
+    ).aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(is_completed=True))
     )
-    roadmap_completed = all_items.filter(is_completed=True).count()
-    roadmap_total = all_items.count()
+    roadmap_completed = roadmap_counts['completed']
+    roadmap_total = roadmap_counts['total']
     roadmap_progress = (roadmap_completed / roadmap_total * 100) if roadmap_total > 0 else 0
 
     # Return JSON response
@@ -804,16 +811,14 @@ def parent_dashboard(request):
         messages.error(request, "Access denied. This page is for parents only.")
         return redirect('tracker:dashboard')
     
-    # Get all linked students
-    children = user_profile.linked_students.all()
+    # Get all linked students (with profiles, used for display names)
+    children = user_profile.linked_students.select_related('profile')
 
     # Get data for each child
     children_data = []
     for child in children:
         # Get subjects
-        subjects = Subject.objects.filter(user=child).prefetch_related(
-            'term_goals', 'study_sessions', 'roadmaps'
-        )
+        subjects = Subject.objects.filter(user=child)
         
         # Calculate metrics
         total_hours = StudySession.objects.filter(
@@ -1001,10 +1006,13 @@ def parent_alert_history(request):
         messages.error(request, "Access denied. This page is for parents only.")
         return redirect('tracker:dashboard')
     
-    # Get all alerts for this parent
+    # Get all alerts for this parent (only the columns the list renders)
     alerts = ProgressAlert.objects.filter(
         parent=request.user
-    ).select_related('student', 'related_subject', 'related_roadmap')
+    ).select_related('student', 'related_subject', 'related_roadmap').only(
+        'id', 'alert_type', 'severity', 'title', 'message', 'is_read', 'created_at',
+        'student__username', 'related_subject__name', 'related_roadmap__title',
+    )
 
     # Filter by type if specified
     alert_type = request.GET.get('type')
@@ -1078,15 +1086,11 @@ def mark_all_alerts_read(request):
     if user_profile.role != 'parent':
         return JsonResponse({'error': 'Not a parent'}, status=403)
     
-    unread_alerts = ProgressAlert.objects.filter(
+    # Single UPDATE; returns the number of alerts marked
+    count = ProgressAlert.objects.filter(
         parent=request.user,
         is_read=False
-    )
-    
-    count = unread_alerts.count()
-    
-    for alert in unread_alerts:
-        alert.mark_as_read()
+    ).update(is_read=True, read_at=timezone.now())
     
     return JsonResponse({
         'success': True,